@@ -9,7 +9,9 @@
 //! - Parallelized RAW decoding with optimized sub-sampling.
 //! - SIMD-accelerated pixel manipulation (via Rayon and image crates).
 //! - Single-pass filter application to minimize memory bandwidth overhead.
-//! - Real-time IPC progress reporting via JSON-formatted stdout.
+//! - Real-time IPC progress reporting via JSON lines or length-prefixed MessagePack frames.
+//! - Optional persistent daemon mode that accepts batch jobs over stdin.
+//! - Input manifests read from shared memory, skipping the filesystem round-trip.
 //!
 //! @author Alejandro Ramírez
 //! @version 2.2.0
@@ -24,7 +26,7 @@ use std::path::{Path, PathBuf};
 use std::sync::Arc;
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::fs::File;
-use std::io::BufReader;
+use std::io::{BufRead, BufReader, Write};
 
 /// Command-line argument schema for the core processor.
 ///
@@ -35,16 +37,41 @@ use std::io::BufReader;
 struct Args {
     /// Serialized JSON string of `ProcessOptions`.
     /// Encapsulates all filters and image adjustments to be applied.
-    #[arg(short, long)]
-    options: String,
+    #[arg(short, long, required_unless_present = "daemon")]
+    options: Option<String>,
 
     /// Comma-separated list of absolute paths OR path to a JSON manifest file.
-    #[arg(short, long)]
-    inputs: String,
+    #[arg(short, long, required_unless_present_any = ["daemon", "inputs_shm"])]
+    inputs: Option<String>,
+
+    /// Name of a shared-memory block holding the JSON manifest (replaces `--inputs`).
+    #[arg(long, conflicts_with = "inputs", requires = "inputs_len")]
+    inputs_shm: Option<String>,
+
+    /// Length in bytes of the manifest stored in `--inputs-shm`.
+    #[arg(long)]
+    inputs_len: Option<usize>,
 
     /// Target destination directory for processed outputs.
-    #[arg(short, long)]
-    output: String,
+    #[arg(short, long, required_unless_present = "daemon")]
+    output: Option<String>,
+
+    /// Run as a persistent worker that reads one JSON `Job` per stdin line.
+    #[arg(long)]
+    daemon: bool,
+
+    /// Encoding of progress packets written to stdout.
+    #[arg(long, value_enum, default_value_t = IpcFormat::Json)]
+    ipc: IpcFormat,
+}
+
+/// Wire format for progress packets sent to the parent GUI.
+#[derive(clap::ValueEnum, Clone, Copy, Debug, PartialEq, Eq)]
+enum IpcFormat {
+    /// One JSON object per line (legacy, human-readable).
+    Json,
+    /// `[u32 little-endian length][MessagePack map]` frames.
+    Msgpack,
 }
 
 /// Image adjustment parameters and filter toggles.
@@ -64,9 +91,20 @@ struct ProcessOptions {
     pub denoise: bool,
 }
 
+/// A batch submitted to the persistent worker (`--daemon`) as one stdin line.
+#[derive(Debug, Deserialize)]
+struct Job {
+    /// Absolute paths of the assets to process.
+    pub inputs: Vec<String>,
+    /// Target destination directory for processed outputs.
+    pub output: String,
+    /// Filters and adjustments applied to every asset.
+    pub options: ProcessOptions,
+}
+
 /// Structured progress update for IPC.
 ///
-/// Emitted to stdout as a JSON object, allowing the parent process to 
+/// Emitted to stdout (see `emit`) as a JSON line or MessagePack frame, allowing the parent process to 
 /// update UI progress bars and status labels in real-time.
 #[derive(Serialize)]
 struct Progress {
@@ -78,6 +116,76 @@ struct Progress {
     pub status: String,
 }
 
+/// Writes a progress packet to stdout using the negotiated IPC framing.
+///
+/// The stdout lock is held for the whole packet so frames emitted concurrently 
+/// from Rayon workers never interleave. Write errors (e.g. the GUI closed the 
+/// pipe) are ignored so they cannot abort the batch.
+fn emit(progress: &Progress, ipc: IpcFormat) {
+    let stdout = std::io::stdout();
+    let mut out = stdout.lock();
+    match ipc {
+        IpcFormat::Json => {
+            let _ = writeln!(out, "{}", serde_json::to_string(progress).unwrap());
+        }
+        IpcFormat::Msgpack => {
+            let payload = rmp_serde::to_vec_named(progress).unwrap();
+            let _ = out.write_all(&(payload.len() as u32).to_le_bytes());
+            let _ = out.write_all(&payload);
+            let _ = out.flush();
+        }
+    }
+}
+
+/// Reads the JSON manifest the GUI placed in a POSIX shared-memory object.
+///
+/// The parent creates the object with Python's `multiprocessing.shared_memory`, 
+/// which reports the name without the leading slash required by `shm_open`. 
+/// The manifest is parsed straight from the mapping, so no disk round-trip occurs.
+#[cfg(unix)]
+fn read_shm_manifest(name: &str, len: usize) -> anyhow::Result<Vec<String>> {
+    let c_name = std::ffi::CString::new(format!("/{}", name.trim_start_matches('/')))?;
+    unsafe {
+        let fd = libc::shm_open(c_name.as_ptr(), libc::O_RDONLY, 0);
+        if fd < 0 {
+            return Err(std::io::Error::last_os_error().into());
+        }
+        let ptr = libc::mmap(std::ptr::null_mut(), len, libc::PROT_READ, libc::MAP_SHARED, fd, 0);
+        libc::close(fd);
+        if ptr == libc::MAP_FAILED {
+            return Err(std::io::Error::last_os_error().into());
+        }
+        let parsed = serde_json::from_slice(std::slice::from_raw_parts(ptr as *const u8, len));
+        libc::munmap(ptr, len);
+        Ok(parsed?)
+    }
+}
+
+/// Reads the JSON manifest the GUI placed in a named Windows file mapping.
+#[cfg(windows)]
+fn read_shm_manifest(name: &str, len: usize) -> anyhow::Result<Vec<String>> {
+    use windows_sys::Win32::Foundation::CloseHandle;
+    use windows_sys::Win32::System::Memory::{MapViewOfFile, OpenFileMappingW, UnmapViewOfFile, FILE_MAP_READ};
+
+    let wide: Vec<u16> = name.encode_utf16().chain(std::iter::once(0)).collect();
+    unsafe {
+        let handle = OpenFileMappingW(FILE_MAP_READ, 0, wide.as_ptr());
+        if handle == 0 {
+            return Err(std::io::Error::last_os_error().into());
+        }
+        let view = MapViewOfFile(handle, FILE_MAP_READ, 0, 0, len);
+        if view.Value.is_null() {
+            let err = std::io::Error::last_os_error();
+            CloseHandle(handle);
+            return Err(err.into());
+        }
+        let parsed = serde_json::from_slice(std::slice::from_raw_parts(view.Value as *const u8, len));
+        UnmapViewOfFile(view);
+        CloseHandle(handle);
+        Ok(parsed?)
+    }
+}
+
 /// Decodes professional RAW image files with an emphasis on speed over fidelity.
 ///
 /// Implements a "half-size" demosaicing algorithm that skips full interpolation 
@@ -208,29 +316,20 @@ fn apply_filters(img: DynamicImage, options: &ProcessOptions) -> DynamicImage {
     final_img
 }
 
-/// Core Orchestrator for ClioBulk-X.
+/// Processes one batch of assets and reports progress to the parent GUI.
 ///
-/// Responsible for:
-/// 1. Bootstrapping the CLI environment and parsing parameters.
-/// 2. Discovering input assets (from string lists or JSON manifests).
-/// 3. Spawning a high-concurrency Rayon pool for image processing.
-/// 4. Managing file-system operations and IPC reporting.
-fn main() -> anyhow::Result<()> {
-    let args = Args::parse();
-    let options: ProcessOptions = serde_json::from_str(&args.options)?;
-    
-    // Resolve input sources: supports raw string lists or JSON path arrays.
-    let input_paths: Vec<String> = if args.inputs.ends_with(".json") && Path::new(&args.inputs).exists() {
-        let file = File::open(&args.inputs)?;
-        let reader = BufReader::new(file);
-        serde_json::from_reader(reader)?
-    } else {
-        args.inputs.split(',').map(|s| s.to_string()).collect()
-    };
-
+/// Shared by the one-shot CLI mode and the persistent daemon. Per-file failures 
+/// are reported and skipped; a `complete` packet is emitted once the batch drains.
+///
+/// # Arguments
+/// * `input_paths` - Absolute paths of the assets to process.
+/// * `output` - Target destination directory (created if missing).
+/// * `options` - Filters and adjustments applied to every asset.
+/// * `ipc` - Framing used for progress packets.
+fn run_batch(input_paths: Vec<String>, output: &str, options: &ProcessOptions, ipc: IpcFormat) -> anyhow::Result<()> {
     let total = input_paths.len();
     let counter = Arc::new(AtomicUsize::new(0));
-    let output_dir = PathBuf::from(&args.output);
+    let output_dir = PathBuf::from(output);
 
     // Ensure output target exists
     if !output_dir.exists() {
@@ -248,8 +347,8 @@ fn main() -> anyhow::Result<()> {
             current_file: name.clone(),
             status: "processing".to_string(),
         };
-        // Print JSON progress update for the parent GUI process
-        println!("{}", serde_json::to_string(&prog).unwrap());
+        // Report progress to the parent GUI process
+        emit(&prog, ipc);
 
         let res = (|| -> anyhow::Result<()> {
             let name_lower = name.to_lowercase();
@@ -263,7 +362,7 @@ fn main() -> anyhow::Result<()> {
                 image::open(path)?
             };
 
-            img = apply_filters(img, &options);
+            img = apply_filters(img, options);
             // Save as JPEG with default compression
             let out_path = output_dir.join(format!("processed_{}.jpg", name));
             img.save(out_path)?;
@@ -277,16 +376,79 @@ fn main() -> anyhow::Result<()> {
                 current_file: name,
                 status: format!("error: {}", e),
             };
-            println!("{}", serde_json::to_string(&err_prog).unwrap());
+            emit(&err_prog, ipc);
         }
     });
 
     // Signal completion to the parent process
-    println!("{}", serde_json::to_string(&Progress {
+    emit(&Progress {
         progress: 100.0,
         current_file: "Done".to_string(),
         status: "complete".to_string(),
-    }).unwrap());
+    }, ipc);
 
     Ok(())
 }
+
+/// Persistent worker loop used with `--daemon`.
+///
+/// Reads one JSON `Job` per stdin line and runs it with the already-initialized 
+/// Rayon pool, so consecutive batches skip process startup entirely. Every job 
+/// ends with exactly one terminal packet: `complete`, or `failed: <reason>` when 
+/// the job could not run. Returns when the parent closes stdin.
+fn run_daemon(ipc: IpcFormat) -> anyhow::Result<()> {
+    let stdin = std::io::stdin();
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+        let res = serde_json::from_str::<Job>(&line)
+            .map_err(anyhow::Error::from)
+            .and_then(|job| run_batch(job.inputs, &job.output, &job.options, ipc));
+        if let Err(e) = res {
+            emit(&Progress {
+                progress: 100.0,
+                current_file: "Batch".to_string(),
+                status: format!("failed: {}", e),
+            }, ipc);
+        }
+    }
+    Ok(())
+}
+
+/// Core Orchestrator for ClioBulk-X.
+///
+/// Responsible for:
+/// 1. Bootstrapping the CLI environment and parsing parameters.
+/// 2. Discovering input assets (from string lists or JSON manifests).
+/// 3. Spawning a high-concurrency Rayon pool for image processing.
+/// 4. Managing file-system operations and IPC reporting.
+fn main() -> anyhow::Result<()> {
+    let args = Args::parse();
+    if args.daemon {
+        return run_daemon(args.ipc);
+    }
+
+    // clap guarantees these are present outside daemon mode
+    let (Some(options), Some(output)) = (args.options, args.output) else {
+        anyhow::bail!("--options and --output are required");
+    };
+    let options: ProcessOptions = serde_json::from_str(&options)?;
+    
+    // Resolve input sources: shared-memory manifests, raw string lists or JSON path arrays.
+    let input_paths: Vec<String> = if let (Some(shm), Some(len)) = (&args.inputs_shm, args.inputs_len) {
+        read_shm_manifest(shm, len)?
+    } else {
+        let inputs = args.inputs.unwrap_or_default();
+        if inputs.ends_with(".json") && Path::new(&inputs).exists() {
+            let file = File::open(&inputs)?;
+            let reader = BufReader::new(file);
+            serde_json::from_reader(reader)?
+        } else {
+            inputs.split(',').map(|s| s.to_string()).collect()
+        }
+    };
+
+    run_batch(input_paths, &output, &options, args.ipc)
+}
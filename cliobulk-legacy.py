@@ -7,7 +7,7 @@ This edition focuses on stable, linear batch processing for standard professiona
 photography workflows.
 
 DESIGN PATTERN:
-- Uses a background QThread to manage the native subprocess without blocking the UI.
+- Drives the native subprocess with QProcess on the GUI event loop (no worker thread).
 - Implements real-time JSON-based IPC for progress monitoring.
 - Styled with a dark-themed, modern aesthetic for low-light editing environments.
 
@@ -19,65 +19,47 @@ DESIGN PATTERN:
 
 import sys
 import os
-import json
-import subprocess
+
+from cliobulk_ipc import json_dumps, PacketDecoder, IPC_FORMAT, configure_spawn
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QListWidget, QFileDialog, QSlider, QLabel, 
                              QCheckBox, QProgressBar, QFrame)
-from PySide6.QtCore import Qt, QThread, Signal, QProcess
+from PySide6.QtCore import Qt, QProcess, QTimer, Slot
 
-class ProcessingThread(QThread):
+class ValueLabel(QLabel):
     """
-    Background worker thread responsible for orchestrating the native Rust core.
+    Slider caption rendered from a format template.
     
-    Reads stdout from the core process in real-time to parse JSON progress packets
-    and emit signals to the main UI thread.
+    A slider drag emits valueChanged far faster than the screen refreshes, so the 
+    newest value is stashed and the text is rendered at most once per 16 ms frame.
     """
-    progress_update = Signal(dict)
-    finished_signal = Signal()
-
-    def __init__(self, core_path, inputs, output_dir, options):
+    def __init__(self, template, value, scale=1):
         """
-        Initializes the processing orchestrator.
-        
         Args:
-            core_path (str): Absolute path to the cliobulk-core executable.
-            inputs (list): List of absolute paths to source images.
-            output_dir (str): Target directory for processed outputs.
-            options (dict): Dictionary of filters and image adjustments.
+            template (str): Format string applied to the scaled value.
+            value (int): Initial raw slider value.
+            scale (int): Divisor mapping raw slider units to displayed units.
         """
         super().__init__()
-        self.core_path = core_path
-        self.inputs = inputs
-        self.output_dir = output_dir
-        self.options = options
+        self.template = template
+        self.scale = scale
+        self._pending = value
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._render)
+        self._render()
 
-    def run(self):
-        """
-        Execution entry point for the thread. Spawns the subprocess.
-        """
-        cmd = [
-            self.core_path,
-            "--inputs", ",".join(self.inputs),
-            "--output", self.output_dir,
-            "--options", json.dumps(self.options)
-        ]
-        
-        # Spawn native process with hidden window on Windows
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                 text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-        
-        # Parse real-time progress updates from the core's stdout
-        for line in process.stdout:
-            try:
-                data = json.loads(line.strip())
-                self.progress_update.emit(data)
-            except (json.JSONDecodeError, ValueError):
-                # Ignore non-JSON output (e.g., debug logs)
-                pass
-        
-        process.wait()
-        self.finished_signal.emit()
+    @Slot(int)
+    def setValue(self, v):
+        """Records a raw slider value and schedules a coalesced repaint."""
+        self._pending = v
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _render(self):
+        self.setText(self.template.format(self._pending / self.scale))
 
 class ClioBulkX(QMainWindow):
     """
@@ -103,6 +85,9 @@ class ClioBulkX(QMainWindow):
         """)
 
         self.files = []
+        self._files_set = set()  # O(1) membership mirror of self.files
+        self._options_cache = (None, b"")  # (options dict, serialized JSON bytes)
+        self._last_percent = -1
         # Path resolution for the native binary
         self.core_path = os.path.join(os.path.dirname(__file__), "cliobulk-core", "target", "release", "cliobulk-core.exe")
 
@@ -121,30 +106,30 @@ class ClioBulkX(QMainWindow):
         sidebar_layout.addWidget(QLabel("ADJUSTMENTS"))
         
         # Brightness Control
-        self.brightness_label = QLabel("Brightness: 0%")
+        self.brightness_label = ValueLabel("Brightness: {:.0f}%", 0)
         sidebar_layout.addWidget(self.brightness_label)
         self.brightness_slider = QSlider(Qt.Horizontal)
         self.brightness_slider.setRange(-100, 100)
         self.brightness_slider.setValue(0)
-        self.brightness_slider.valueChanged.connect(lambda v: self.brightness_label.setText(f"Brightness: {v}%"))
+        self.brightness_slider.valueChanged.connect(self.brightness_label.setValue)
         sidebar_layout.addWidget(self.brightness_slider)
 
         # Contrast Control
-        self.contrast_label = QLabel("Contrast: 1.0x")
+        self.contrast_label = ValueLabel("Contrast: {:.1f}x", 10, scale=10)
         sidebar_layout.addWidget(self.contrast_label)
         self.contrast_slider = QSlider(Qt.Horizontal)
         self.contrast_slider.setRange(0, 30)
         self.contrast_slider.setValue(10)
-        self.contrast_slider.valueChanged.connect(lambda v: self.contrast_label.setText(f"Contrast: {v/10:.1f}x"))
+        self.contrast_slider.valueChanged.connect(self.contrast_label.setValue)
         sidebar_layout.addWidget(self.contrast_slider)
 
         # Saturation Control
-        self.saturation_label = QLabel("Saturation: 1.0x")
+        self.saturation_label = ValueLabel("Saturation: {:.1f}x", 10, scale=10)
         sidebar_layout.addWidget(self.saturation_label)
         self.saturation_slider = QSlider(Qt.Horizontal)
         self.saturation_slider.setRange(0, 20)
         self.saturation_slider.setValue(10)
-        self.saturation_slider.valueChanged.connect(lambda v: self.saturation_label.setText(f"Saturation: {v/10:.1f}x"))
+        self.saturation_slider.valueChanged.connect(self.saturation_label.setValue)
         sidebar_layout.addWidget(self.saturation_slider)
 
         # Filter Toggles
@@ -189,25 +174,55 @@ class ClioBulkX(QMainWindow):
 
         layout.addLayout(content_layout)
 
+        # Progress sampler: repaints at most ~30 Hz regardless of core throughput
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self.poll_progress)
+
+        # Native core process, serviced from the event loop as output arrives.
+        # Only progress packets matter, so diagnostics on stderr are discarded.
+        self._decoder = None
+        self._latest = None
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.SeparateChannels)
+        self.process.setStandardErrorFile(QProcess.nullDevice())
+        configure_spawn(self.process)
+        self.process.readyReadStandardOutput.connect(self.read_progress)
+        self.process.finished.connect(self.on_finished)
+        self.process.errorOccurred.connect(self.on_process_error)
+
     def add_files(self):
         """Opens a file dialog to append images to the processing queue."""
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Images", "", 
             "Images (*.png *.jpg *.jpeg *.webp *.arw *.cr2 *.nef *.dng)"
         )
-        if files:
-            self.files.extend(files)
-            self.file_list.addItems(files)
+        new_files = []
+        for f in files:
+            if f not in self._files_set:
+                self._files_set.add(f)
+                new_files.append(f)
+        if new_files:
+            self.files.extend(new_files)
+            # Suspend repaints/signals so the list relayouts once per import
+            self.file_list.setUpdatesEnabled(False)
+            self.file_list.blockSignals(True)
+            try:
+                self.file_list.addItems(new_files)
+            finally:
+                self.file_list.blockSignals(False)
+                self.file_list.setUpdatesEnabled(True)
 
     def clear_files(self):
         """Clears the entire input queue."""
         self.files = []
+        self._files_set = set()
         self.file_list.clear()
 
     def start_processing(self):
         """
         Initializes the batch processing sequence.
-        Collects UI parameters and launches the background thread.
+        Collects UI parameters and launches the native core process.
         """
         if not self.files: return
         
@@ -222,28 +237,70 @@ class ClioBulkX(QMainWindow):
             "denoise": self.denoise_cb.isChecked(),
             "adaptive_threshold": self.threshold_cb.isChecked()
         }
+        options_bytes = self.serialize_options(options)
 
         self.process_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self._last_percent = 0
         
-        # Start background orchestration
-        self.thread = ProcessingThread(self.core_path, self.files, output_dir, options)
-        self.thread.progress_update.connect(self.update_ui)
-        self.thread.finished_signal.connect(self.on_finished)
-        self.thread.start()
-
-    def update_ui(self, data):
-        """Callback for real-time progress updates from the background thread."""
-        self.progress_bar.setValue(int(data.get("progress", 0)))
-        self.status_label.setText(f"Processing: {data.get('current_file', '')}")
-
-    def on_finished(self):
+        # Start native orchestration
+        self._decoder = PacketDecoder(IPC_FORMAT)
+        self._latest = None
+        self.process.start(self.core_path, [
+            "--inputs", ",".join(self.files),
+            "--output", output_dir,
+            "--options", options_bytes.decode(),
+            "--ipc", IPC_FORMAT
+        ])
+        self.progress_timer.start()
+
+    def serialize_options(self, options):
+        """Returns the JSON encoding of `options`, reusing it while the preset is unchanged."""
+        cached_options, cached_bytes = self._options_cache
+        if options != cached_options:
+            cached_bytes = json_dumps(options)
+            self._options_cache = (options, cached_bytes)
+        return cached_bytes
+
+    def read_progress(self):
+        """Buffers the newest packet from whatever stdout bytes are available."""
+        data = self._decoder.feed(bytes(self.process.readAllStandardOutput()))
+        if data is not None:
+            self._latest = data
+
+    def poll_progress(self):
+        """Timer slot that forwards the latest buffered packet (if any) to the UI."""
+        data, self._latest = self._latest, None
+        if data is not None:
+            self.update_ui(*data)
+
+    def update_ui(self, percent, current_file, status):
+        """Applies a progress packet from the core to the UI."""
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress_bar.setValue(percent)
+        self.status_label.setText(f"Processing: {current_file}")
+
+    def on_finished(self, exit_code=0, exit_status=None):
         """Handles post-processing UI restoration."""
+        data = self._decoder.flush()
+        if data is not None:
+            self._latest = data
+        self.progress_timer.stop()
+        self.poll_progress()
         self.process_btn.setEnabled(True)
         self.status_label.setText("Batch Complete!")
         self.progress_bar.setValue(100)
 
+    def on_process_error(self, error):
+        """Restores the UI when the core executable cannot be launched."""
+        # finished() is never emitted in this case
+        if error == QProcess.FailedToStart:
+            self.progress_timer.stop()
+            self.process_btn.setEnabled(True)
+            self.status_label.setText(f"Failed to start core: {self.process.errorString()}")
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = ClioBulkX()
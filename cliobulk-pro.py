@@ -10,91 +10,409 @@ to bypass shell buffer limits, and a hardware-accelerated modern UX.
 
 import sys
 import os
-import json
 import base64
-import subprocess
 import tempfile
+from collections import OrderedDict
+from multiprocessing import shared_memory
 from pathlib import Path
+
+from cliobulk_ipc import json_dumps, PacketDecoder, IPC_FORMAT, configure_spawn
+
+# Optional Pillow (ideally the AVX2 Pillow-SIMD build) for faster thumbnail decoding
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+# Style sheet compiled into a Qt resource (pyside6-rcc cliobulk-pro.qrc -o cliobulk_rc.py);
+# the .qss file next to this script is read when the module is not built.
+try:
+    import cliobulk_rc
+except ImportError:
+    cliobulk_rc = None
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QListWidget, QFileDialog, QSlider, QLabel, 
+                             QPushButton, QListView, QFileDialog, QSlider, QLabel, 
                              QCheckBox, QProgressBar, QFrame, QScrollArea, QGraphicsView,
-                             QGraphicsScene, QSplitter, QListWidgetItem, QLineEdit, QMessageBox)
-from PySide6.QtCore import Qt, QThread, Signal, QSize, QPropertyAnimation, QEasingCurve, QTimer
-from PySide6.QtGui import QPixmap, QImage, QIcon, QFont, QColor, QPalette
-
-class ProcessingThread(QThread):
+                             QGraphicsScene, QSplitter, QLineEdit, QMessageBox)
+from PySide6.QtCore import (Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, QTimer,
+                            QObject, QRunnable, QThreadPool, QProcess, QAbstractListModel, QModelIndex,
+                            QPersistentModelIndex, QFile, QIODevice)
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QIcon, QFont, QColor, QPalette
+
+# RAW formats decoded by the native core only (suffix tuple for str.endswith)
+RAW_EXTS = ('.arw', '.cr2', '.nef', '.dng')
+# File dialog filter for importable assets
+IMAGE_FILTER = "Images (*.png *.jpg *.jpeg *.webp *.arw *.cr2 *.nef *.dng)"
+# Bounding box of queue thumbnails
+THUMB_SIZE = QSize(120, 120)
+# Max entries in the scaled-preview LRU cache
+PREVIEW_CACHE_SIZE = 16
+# Max full-resolution sources kept for rescaling (~96 MB each for a 24 MP photo)
+SOURCE_CACHE_SIZE = 2
+
+# Application style sheet: compiled resource path, else the file beside this script
+STYLE_PATH = ":/style.qss" if cliobulk_rc is not None else str(Path(__file__).with_name("cliobulk-pro.qss"))
+
+def load_stylesheet(path=STYLE_PATH):
     """
-    High-performance orchestration thread for the native image engine.
+    Reads the application style sheet once at startup.
+    
+    The sheet is installed on the QApplication, so it is parsed a single time; 
+    widgets select their look through the dynamic `role` property rather than 
+    carrying their own style sheets. Returns an empty string if unreadable.
+    """
+    f = QFile(path)
+    if not f.open(QIODevice.ReadOnly | QIODevice.Text):
+        return ""
+    try:
+        return bytes(f.readAll()).decode('utf-8')
+    finally:
+        f.close()
+
+class CoreProcess(QObject):
+    """
+    One-shot run of the native image engine, driven by QProcess.
     
     Implements a manifest-based IPC strategy to allow processing of virtually 
     unlimited file counts in a single batch, avoiding shell buffer overflows.
+    The manifest is handed over in shared memory (temp file as fallback).
+    Output is delivered on the GUI event loop via readyReadStandardOutput, so no 
+    thread or blocking pipe read is involved. Progress is exposed as a single 
+    latest-packet slot sampled by the UI timer.
     """
-    progress_update = Signal(dict)
     finished_signal = Signal()
     error_signal = Signal(str)
 
-    def __init__(self, core_path, inputs, output_dir, options):
+    def __init__(self, core_path, parent=None):
         """
-        Initializes the thread with processing context.
+        Initializes the process wrapper.
         
         Args:
             core_path (str): Path to cliobulk-core.exe.
+        """
+        super().__init__(parent)
+        self.core_path = core_path
+        self.ipc = IPC_FORMAT
+        self._decoder = PacketDecoder(self.ipc)
+        self._latest = None
+        self._stderr = bytearray()
+        self._temp_file = None
+        self._shm = None
+        self._payload = b""
+        self._batch_args = []
+
+        self.proc = QProcess(self)
+        self.proc.setProcessChannelMode(QProcess.SeparateChannels)
+        configure_spawn(self.proc)
+        self.proc.readyReadStandardOutput.connect(self._on_stdout)
+        self.proc.readyReadStandardError.connect(self._on_stderr)
+        self.proc.finished.connect(self._on_exit)
+        self.proc.errorOccurred.connect(self._on_proc_error)
+
+    def submit(self, inputs, output_dir, options):
+        """
+        Writes the manifest and launches the core for one batch.
+        
+        Args:
             inputs (list): Absolute paths of assets to process.
             output_dir (str): Destination directory.
-            options (dict): Global filter settings.
+            options (bytes): Global filter settings, pre-serialized as JSON.
         """
-        super().__init__()
-        self.core_path = core_path
-        self.inputs = inputs
-        self.output_dir = output_dir
-        self.options = options
+        # Manifest Generation: the path list is serialized in one call.
+        # This allows the core to read thousands of paths without CLI overhead.
+        self._payload = json_dumps(inputs)
+        self._batch_args = [
+            "--output", output_dir,
+            "--options", options.decode(),
+            "--ipc", self.ipc
+        ]
+        self._launch(use_shm=True)
+
+    def _launch(self, use_shm):
+        """Publishes the manifest and starts the core process."""
+        self.proc.start(self.core_path, self._write_manifest(use_shm) + self._batch_args)
+
+    def _write_manifest(self, use_shm):
+        """
+        Publishes the serialized manifest; returns the matching core arguments.
+        
+        A shared-memory block lets the core parse the manifest straight from RAM. 
+        A temporary file (written in one syscall) is used when shared memory is 
+        unavailable or the core predates `--inputs-shm`.
+        """
+        payload = self._payload
+        if use_shm and payload:
+            try:
+                self._shm = shared_memory.SharedMemory(create=True, size=len(payload))
+            except OSError:
+                self._shm = None
+            if self._shm is not None:
+                self._shm.buf[:len(payload)] = payload
+                return ["--inputs-shm", self._shm.name, "--inputs-len", str(len(payload))]
+
+        fd, self._temp_file = tempfile.mkstemp(suffix='.json')
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        return ["--inputs", self._temp_file]
+
+    def _release_manifest(self):
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except OSError:
+                pass
+            self._shm = None
+        if self._temp_file and os.path.exists(self._temp_file):
+            try: os.unlink(self._temp_file)
+            except: pass
         self._temp_file = None
 
+    def take_latest(self):
+        """Returns and clears the newest progress packet (None if nothing new)."""
+        data, self._latest = self._latest, None
+        return data
+
+    def _on_stdout(self):
+        data = self._decoder.feed(bytes(self.proc.readAllStandardOutput()))
+        if data is not None:
+            self._on_packet(data)
+
+    def _on_packet(self, data):
+        """Stores a decoded packet for the UI sampler."""
+        self._latest = data
+
+    def _on_stderr(self):
+        self._stderr += bytes(self.proc.readAllStandardError())
+        del self._stderr[:-65536]  # keep only the tail for diagnostics
+
+    def _on_exit(self, code, status):
+        # A core without shared-memory support rejects the flag (clap usage error,
+        # exit code 2) before doing any work: retry once through a temp file.
+        if self._shm is not None and code == 2 and b"--inputs-shm" in self._stderr:
+            self._release_manifest()
+            self._stderr.clear()
+            self._launch(use_shm=False)
+            return
+        data = self._decoder.flush()
+        if data is not None:
+            self._on_packet(data)
+        # Catch crashes / non-zero exit codes and report captured stderr
+        if status != QProcess.NormalExit or code != 0:
+            err = self._stderr.decode(errors='replace')
+            self.error_signal.emit(f"Core error ({code}): {err}")
+        self._finish()
+
+    def _on_proc_error(self, error):
+        # finished() is never emitted when the executable cannot be launched
+        if error == QProcess.FailedToStart:
+            self.error_signal.emit(f"Failed to start core: {self.proc.errorString()}")
+            self._finish()
+
+    def _finish(self):
+        # Cleanup manifest
+        self._release_manifest()
+        self.finished_signal.emit()
+
+class CoreDaemon(CoreProcess):
+    """
+    Persistent native core worker fed batch jobs over stdin (`--daemon`).
+    
+    Keeping one core alive amortizes process startup, DLL loading and Rayon pool 
+    creation across batches. Exposes the same submit / take_latest / 
+    finished_signal / error_signal surface as CoreProcess.
+    """
+    def __init__(self, core_path, parent=None):
+        super().__init__(core_path, parent)
+        self.busy = False
+        self.unsupported = False  # core rejected --daemon or cannot launch; no respawn
+        self.proc.start(core_path, ["--daemon", "--ipc", self.ipc])
+
+    def is_running(self):
+        """True while the daemon process is alive and able to accept jobs."""
+        return self.proc.state() != QProcess.NotRunning
+
+    def submit(self, inputs, output_dir, options):
+        """
+        Queues a batch on the daemon as one JSON line on its stdin.
+        
+        Args:
+            inputs (list): Absolute paths of assets to process.
+            output_dir (str): Destination directory.
+            options (bytes): Global filter settings, pre-serialized as JSON.
+        """
+        self.busy = True
+        self._latest = None
+        self._stderr.clear()  # diagnostics should describe this batch only
+        self.proc.write(b'{"inputs":' + json_dumps(inputs) +
+                        b',"output":' + json_dumps(output_dir) +
+                        b',"options":' + options + b'}\n')
+
+    def shutdown(self, timeout_ms=1000):
+        """Closes stdin so the daemon exits cleanly; kills it if it lingers."""
+        if not self.is_running():
+            return
+        # A deliberate stop abandons any running job; it is not a core failure
+        self.busy = False
+        self.proc.closeWriteChannel()
+        if not self.proc.waitForFinished(timeout_ms):
+            self.proc.kill()
+            self.proc.waitForFinished(timeout_ms)
+
+    def _on_packet(self, data):
+        self._latest = data
+        # Every job ends with exactly one terminal packet
+        status = data[2]
+        if status == "complete" or status.startswith("failed"):
+            self.busy = False
+            if status != "complete":
+                self.error_signal.emit(f"Core error: {status}")
+            self.finished_signal.emit()
+
+    def _on_exit(self, code, status):
+        # Exiting while idle needs no report (the next batch respawns the worker),
+        # unless a clap usage error (exit code 2) naming the flag shows this core
+        # build has no daemon mode at all.
+        if not self.busy:
+            self.unsupported = code == 2 and b"--daemon" in self._stderr
+        else:
+            self.busy = False
+            err = self._stderr.decode(errors='replace')
+            self.error_signal.emit(f"Core daemon exited ({code}): {err}")
+            self.finished_signal.emit()
+
+    def _on_proc_error(self, error):
+        # A daemon that fails to launch leaves batches on the per-batch fallback;
+        # flag it so start_processing does not block retrying a doomed respawn.
+        if error == QProcess.FailedToStart:
+            self.unsupported = True
+
+class ThumbnailSignals(QObject):
+    """Signal carrier for ThumbnailJob (QRunnable is not a QObject)."""
+    ready = Signal(str, QImage)
+
+class ThumbnailJob(QRunnable):
+    """
+    Pooled worker that decodes a queue thumbnail off the GUI thread.
+    
+    Pillow(-SIMD) is preferred when installed; otherwise QImageReader is used. Both 
+    scale while decoding (IDCT scaling for JPEG), so full-resolution pixels are 
+    never materialized. A QImage is emitted because QPixmap may only be created on 
+    the GUI thread.
+    """
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
     def run(self):
-        """Entry point for parallel execution orchestration."""
+        image = self._decode_pillow() if Image is not None else None
+        if image is None:
+            image = self._decode_qt()
+        if not image.isNull():
+            self.signals.ready.emit(self.path, image)
+
+    def _decode_pillow(self):
+        """Decodes via Pillow; returns None so unsupported files fall back to Qt."""
+        box = (THUMB_SIZE.width(), THUMB_SIZE.height())
         try:
-            # Manifest Generation: Dump path list to a temporary JSON file.
-            # This allows the core to read thousands of paths without CLI overhead.
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(self.inputs, f)
-                self._temp_file = f.name
-
-            cmd = [
-                self.core_path,
-                "--inputs", self._temp_file,
-                "--output", self.output_dir,
-                "--options", json.dumps(self.options)
-            ]
-            
-            # Execute Core in background
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                                     text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            
-            # Continuous Polling of Core's output stream
-            while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
-                if line:
-                    try:
-                        data = json.loads(line.strip())
-                        self.progress_update.emit(data)
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-            
-            # Catch non-zero exit codes and capture stderr
-            if process.returncode != 0:
-                err = process.stderr.read()
-                self.error_signal.emit(f"Core error ({process.returncode}): {err}")
-            
-        except Exception as e:
-            self.error_signal.emit(f"Failed to start core: {str(e)}")
-        finally:
-            # Cleanup manifest
-            if self._temp_file and os.path.exists(self._temp_file):
-                try: os.unlink(self._temp_file)
-                except: pass
-            self.finished_signal.emit()
+            with Image.open(self.path) as im:
+                # JPEG draft mode decodes at a reduced DCT scale close to the target
+                im.draft('RGB', (box[0] * 2, box[1] * 2))
+                im = ImageOps.exif_transpose(im)
+                im.thumbnail(box, Image.BILINEAR)
+                im = im.convert('RGBA')
+                buf = im.tobytes('raw', 'RGBA')
+                # copy() detaches the QImage from the Python-owned buffer
+                return QImage(buf, im.width, im.height, QImage.Format_RGBA8888).copy()
+        except Exception:
+            return None
+
+    def _decode_qt(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(THUMB_SIZE, Qt.KeepAspectRatio))
+        return reader.read()
+
+class FileListModel(QAbstractListModel):
+    """
+    Lightweight list model over the queued asset paths.
+    
+    Each import is appended inside a single beginInsertRows/endInsertRows block, 
+    so the view relayouts once per batch however many files arrive. Thumbnails are 
+    lazy: a ThumbnailJob is queued the first time the view asks for a row's icon 
+    (i.e. when it scrolls into view); RAW rows never get one.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = []
+        self._rows = {}          # path -> row; O(1) duplicate checks and thumbnail routing
+        self._icons = {}         # path -> decoded thumbnail QIcon
+        self._requested = set()  # paths with a ThumbnailJob in flight or done
+        # Transparent full-size placeholder for loading and RAW rows: a null QIcon
+        # counts as "no decoration", and uniform item sizes would then size every
+        # cell for the text line only (dataChanged never recomputes it).
+        blank = QPixmap(THUMB_SIZE)
+        blank.fill(Qt.transparent)
+        self._no_icon = QIcon(blank)
+        self._thumb_signals = ThumbnailSignals(self)
+        self._thumb_signals.ready.connect(self._on_thumbnail)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(path)
+        if role == Qt.DecorationRole:
+            icon = self._icons.get(path)
+            if icon is not None:
+                return icon
+            if path not in self._requested and not path.lower().endswith(RAW_EXTS):
+                self._requested.add(path)
+                QThreadPool.globalInstance().start(ThumbnailJob(path, self._thumb_signals))
+            return self._no_icon
+        return None
+
+    def add_paths(self, paths):
+        """Appends the paths not already queued; returns how many were added."""
+        new = []
+        for p in paths:
+            if p not in self._rows:
+                self._rows[p] = len(self.paths) + len(new)
+                new.append(p)
+        if new:
+            first = len(self.paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self.paths.extend(new)
+            self.endInsertRows()
+        return len(new)
+
+    def clear(self):
+        """Removes every queued path and drops cached thumbnails."""
+        self.beginResetModel()
+        self.paths = []
+        self._rows = {}
+        self._icons = {}
+        self._requested = set()
+        self.endResetModel()
+
+    def _on_thumbnail(self, path, image):
+        # Results for paths purged while the job was running are discarded
+        row = self._rows.get(path)
+        if row is None:
+            return
+        self._icons[path] = QIcon(QPixmap.fromImage(image))
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
 
 class ModernSlider(QWidget):
     """
@@ -110,9 +428,9 @@ class ModernSlider(QWidget):
         self.scale = scale
         header = QHBoxLayout()
         self.title = QLabel(label)
-        self.title.setStyleSheet("color: #888; font-weight: bold; font-size: 10px; text-transform: uppercase;")
+        self.title.setProperty("role", "caption")
         self.value_label = QLabel(f"{default_v/scale:.1f}")
-        self.value_label.setStyleSheet("color: #00C3FF; font-weight: bold;")
+        self.value_label.setProperty("role", "accent")
         header.addWidget(self.title)
         header.addStretch()
         header.addWidget(self.value_label)
@@ -121,10 +439,6 @@ class ModernSlider(QWidget):
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setRange(min_v, max_v)
         self.slider.setValue(default_v)
-        self.slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #333; height: 4px; border-radius: 2px; }
-            QSlider::handle:horizontal { background: #00C3FF; width: 14px; height: 14px; margin: -5px 0; border-radius: 7px; }
-        """)
         self.slider.valueChanged.connect(self.update_val)
         layout.addWidget(self.slider)
 
@@ -149,39 +463,54 @@ class ClioBulkX(QMainWindow):
         base_dir = Path(__file__).parent
         self.core_path = base_dir / "cliobulk-core" / "target" / "release" / "cliobulk-core.exe"
         
-        self.files = []
+        self.file_model = FileListModel(self)
+        self._opts_cache = (None, b"")  # (options dict, serialized JSON bytes)
+        self._last_percent = -1
+        self._pix_cache = OrderedDict()     # path -> full-res QPixmap (last few only)
+        self._scaled_cache = OrderedDict()  # (path, w, h) -> scaled QPixmap
         self.setup_ui()
+
+        # Preview debounce: only the last selection within 100 ms is decoded
+        self._pending_index = QPersistentModelIndex()
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self._do_preview)
+
+        # Progress sampler: repaints at most ~30 Hz regardless of core throughput
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self.poll_progress)
+
+        # Warm native worker reused by every batch (per-batch spawn is the fallback)
+        self.core_job = None  # active progress source (CoreDaemon or CoreProcess)
+        self.daemon = None
+        if self.core_path.exists():
+            self.daemon = self._spawn_daemon()
         
         # Core Verification Delay
         QTimer.singleShot(500, self.check_core)
 
+    def _spawn_daemon(self):
+        """Starts a warm core worker wired to the batch UI handlers."""
+        daemon = CoreDaemon(str(self.core_path), self)
+        daemon.error_signal.connect(self.on_error, Qt.QueuedConnection)
+        daemon.finished_signal.connect(self.on_done)
+        return daemon
+
     def check_core(self):
         """Verifies that the compiled Rust core is available."""
         if not self.core_path.exists():
             QMessageBox.warning(self, "Core Missing", 
                 f"Native core not found at:\n{self.core_path}\n\nPlease build the Rust project first.")
             self.status_msg.setText("ERROR: NATIVE CORE NOT FOUND")
-            self.status_msg.setStyleSheet("color: #FF4B4B; font-size: 11px; font-weight: bold;")
+            # Role change: re-polish so the global style sheet rules are re-matched
+            self.status_msg.setProperty("role", "error")
+            self.status_msg.style().unpolish(self.status_msg)
+            self.status_msg.style().polish(self.status_msg)
 
     def setup_ui(self):
-        """Constructs the modern application layout using component-based styling."""
-        self.setStyleSheet("""
-            QMainWindow { background-color: #0A0A0C; }
-            QWidget { color: #E0E0E0; font-family: 'Inter', 'Segoe UI'; }
-            QFrame#Sidebar { background-color: #121216; border-right: 1px solid #1F1F24; }
-            QFrame#PreviewArea { background-color: #000; border-radius: 15px; }
-            QPushButton#PrimaryAction { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #0072FF, stop:1 #00C3FF); border: none; padding: 15px; border-radius: 8px; font-weight: 800; color: white; font-size: 14px; }
-            QPushButton#PrimaryAction:hover { background: #00D4FF; }
-            QPushButton#PrimaryAction:disabled { background: #333; color: #666; }
-            QPushButton#Secondary { background: #1F1F24; border: 1px solid #2F2F36; border-radius: 8px; padding: 8px; font-weight: bold; }
-            QPushButton#Secondary:hover { background: #2F2F36; }
-            QLineEdit { background: #1F1F24; border: 1px solid #2F2F36; padding: 10px; border-radius: 8px; }
-            QProgressBar { border: none; background: #1F1F24; height: 6px; border-radius: 3px; text-align: center; }
-            QProgressBar::chunk { background: #00C3FF; border-radius: 3px; }
-            QListWidget { background: #0A0A0C; border: none; outline: none; }
-            QListWidget::item:selected { background: #1F1F24; border-radius: 8px; }
-        """)
-
+        """Constructs the modern application layout using role-based styling."""
         central = QWidget()
         self.setCentralWidget(central)
         main_layout = QHBoxLayout(central)
@@ -198,7 +527,7 @@ class ClioBulkX(QMainWindow):
         side_layout.setContentsMargins(25, 25, 25, 25)
 
         title = QLabel("CLIOBULK PRO X")
-        title.setStyleSheet("font-size: 20px; font-weight: 900; color: white; margin-bottom: 20px;")
+        title.setProperty("role", "title")
         side_layout.addWidget(title)
 
         # Image Processing Parameters
@@ -254,7 +583,7 @@ class ClioBulkX(QMainWindow):
         # Workspace Toolbar
         top_bar = QHBoxLayout()
         count_lbl = QLabel("QUEUE")
-        count_lbl.setStyleSheet("font-weight: 800; font-size: 14px;")
+        count_lbl.setProperty("role", "heading")
         top_bar.addWidget(count_lbl)
         top_bar.addStretch()
         add_btn = QPushButton("ADD SOURCE FILES")
@@ -271,12 +600,15 @@ class ClioBulkX(QMainWindow):
         splitter = QSplitter(Qt.Vertical)
         
         # Asset Grid Visualization
-        self.file_list = QListWidget()
-        self.file_list.setViewMode(QListWidget.IconMode)
-        self.file_list.setIconSize(QSize(120, 120))
-        self.file_list.setResizeMode(QListWidget.Adjust)
+        self.file_list = QListView()
+        self.file_list.setViewMode(QListView.IconMode)
+        self.file_list.setIconSize(THUMB_SIZE)
+        self.file_list.setResizeMode(QListView.Adjust)
         self.file_list.setSpacing(10)
-        self.file_list.itemClicked.connect(self.update_preview)
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setModel(self.file_model)
+        self.file_list.clicked.connect(self.update_preview)
+        self.file_list.selectionModel().currentChanged.connect(self.update_preview)
         splitter.addWidget(self.file_list)
 
         # Cinematic Preview Frame
@@ -285,7 +617,7 @@ class ClioBulkX(QMainWindow):
         prev_layout = QVBoxLayout(preview_frame)
         self.preview_lbl = QLabel("Select an image to preview results")
         self.preview_lbl.setAlignment(Qt.AlignCenter)
-        self.preview_lbl.setStyleSheet("color: #444; font-weight: bold;")
+        self.preview_lbl.setProperty("role", "placeholder")
         prev_layout.addWidget(self.preview_lbl)
         splitter.addWidget(preview_frame)
         
@@ -299,11 +631,11 @@ class ClioBulkX(QMainWindow):
         
         self.status_bar = QHBoxLayout()
         self.status_msg = QLabel("READY")
-        self.status_msg.setStyleSheet("color: #888; font-size: 11px; font-weight: bold;")
+        self.status_msg.setProperty("role", "status")
         self.status_bar.addWidget(self.status_msg)
         self.status_bar.addStretch()
         engine_tag = QLabel("NATIVE RUST CORE v2.2")
-        engine_tag.setStyleSheet("color: #00C3FF; font-size: 10px; font-weight: 800; border: 1px solid #00C3FF; padding: 2px 8px; border-radius: 4px;")
+        engine_tag.setProperty("role", "badge")
         self.status_bar.addWidget(engine_tag)
         content_layout.addLayout(self.status_bar)
 
@@ -312,51 +644,97 @@ class ClioBulkX(QMainWindow):
     def add_files(self):
         """Imports external image assets into the local session queue."""
         paths, _ = QFileDialog.getOpenFileNames(
-            self, "Import Assets", "", 
-            "Images (*.png *.jpg *.jpeg *.webp *.arw *.cr2 *.nef *.dng)"
+            self, "Import Assets", "", IMAGE_FILTER
         )
-        for p in paths:
-            if p not in self.files:
-                self.files.append(p)
-                item = QListWidgetItem(os.path.basename(p))
-                # For standard formats, generate a thumbnail icon
-                if not any(p.lower().endswith(ext) for ext in ['.arw', '.cr2', '.nef', '.dng']):
-                    item.setIcon(QIcon(p))
-                self.file_list.addItem(item)
+        # One row-insertion block per import; thumbnails decode lazily on display
+        self.file_model.add_paths(paths)
 
     def clear_files(self):
         """Resets the current session queue."""
-        self.files = []
-        self.file_list.clear()
+        self._preview_timer.stop()
+        self.file_model.clear()
+        self._pix_cache.clear()
+        self._scaled_cache.clear()
         self.preview_lbl.clear()
         self.preview_lbl.setText("Select an image to preview results")
 
-    def update_preview(self, item):
+    def update_preview(self, index, previous=None):
+        """
+        Schedules a viewport update for the selected asset.
+        
+        Clicks and keyboard navigation restart a 100 ms single-shot timer, so 
+        arrow-keying through the queue only decodes the selection it settles on.
+        """
+        self._pending_index = QPersistentModelIndex(index)
+        self._preview_timer.start()
+
+    def _do_preview(self):
         """
         Updates the primary viewport based on the selected asset.
         
         Note: High-resolution RAW files display metadata alerts as full-res 
         previews are generated dynamically by the native core during processing.
         """
-        path = self.files[self.file_list.row(item)]
-        if any(path.lower().endswith(ext) for ext in ['.arw', '.cr2', '.nef', '.dng']):
+        if not self._pending_index.isValid():
+            return
+        path = self.file_model.paths[self._pending_index.row()]
+        if path.lower().endswith(RAW_EXTS):
             self.preview_lbl.setPixmap(QPixmap()) 
             self.preview_lbl.setText(f"RAW ASSET: {os.path.basename(path)}\n(Optimized Native Processing Active)")
         else:
-            pix = QPixmap(path)
-            if not pix.isNull():
-                self.preview_lbl.setPixmap(pix.scaled(self.preview_lbl.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            pix = self.preview_pixmap(path, self.preview_lbl.size())
+            if pix is not None:
+                self.preview_lbl.setPixmap(pix)
             else:
                 self.preview_lbl.setText("Failed to load preview.")
 
+    @staticmethod
+    def _lru_get(cache, key):
+        """Returns a cached value and marks it most-recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _lru_put(cache, key, value, max_entries=PREVIEW_CACHE_SIZE):
+        """Stores a value, evicting the least-recently used entries when full."""
+        cache[key] = value
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
+    def preview_pixmap(self, path, size):
+        """
+        Returns the preview of `path` fitted to `size`, or None if it cannot be decoded.
+        
+        Scaled renders are memoized, so re-selecting an image is a dictionary lookup. 
+        Only the last few full-resolution sources are kept (they are large), enough 
+        for a label resize to re-run just the scaling step.
+        """
+        key = (path, size.width(), size.height())
+        scaled = self._lru_get(self._scaled_cache, key)
+        if scaled is not None:
+            return scaled
+
+        pix = self._lru_get(self._pix_cache, path)
+        if pix is None:
+            pix = QPixmap(path)
+            if pix.isNull():
+                return None
+            self._lru_put(self._pix_cache, path, pix, SOURCE_CACHE_SIZE)
+
+        scaled = pix.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._lru_put(self._scaled_cache, key, scaled)
+        return scaled
+
     def start_processing(self):
         """
         Triggers the batch processing pipeline.
         
-        Validates environmental dependencies and launches the asynchronous 
-        orchestration thread.
+        Validates environmental dependencies and hands the batch to the warm 
+        daemon, or launches a one-shot core process.
         """
-        if not self.files: return
+        if not self.file_model.paths: return
         if not self.core_path.exists():
             QMessageBox.critical(self, "Error", "Native core not found. Build it first.")
             return
@@ -372,36 +750,76 @@ class ClioBulkX(QMainWindow):
             "denoise": self.denoise.isChecked(),
             "adaptive_threshold": self.threshold.isChecked()
         }
+        opts_bytes = self.serialize_options(opts)
 
         self.process_btn.setEnabled(False)
         self.progress_bar.setValue(0)
+        self._last_percent = 0
         self.status_msg.setText("PREPARING BATCH...")
         
-        # Spawn Orchestrator
-        self.thread = ProcessingThread(str(self.core_path), self.files, out_dir, opts)
-        self.thread.progress_update.connect(self.on_progress)
-        self.error_signal.connect(self.on_error) if hasattr(self, 'error_signal') else None
-        self.thread.finished_signal.connect(self.on_done)
-        self.thread.start()
-
-    def on_progress(self, data):
-        """UI response handler for real-time progress signals."""
-        p = int(data.get("progress", 0))
-        self.progress_bar.setValue(p)
-        cur = data.get('current_file', '').upper()
-        status = data.get('status', 'processing')
-        self.status_msg.setText(f"{status.upper()}: {cur}")
+        daemon = self.daemon
+        if daemon is not None and not daemon.is_running() and not daemon.unsupported:
+            # The previous worker exited (e.g. a decoder panic): respawn it so this
+            # and later batches keep skipping per-batch process startup
+            daemon.deleteLater()
+            self.daemon = daemon = self._spawn_daemon()
+            daemon.proc.waitForStarted(1000)
+
+        if daemon is not None and daemon.is_running():
+            # Dispatch to the warm daemon (signals were connected at spawn)
+            self.core_job = daemon
+        else:
+            # Spawn Orchestrator (core lacks --daemon or the respawn failed)
+            self.core_job = CoreProcess(str(self.core_path))
+            self.core_job.error_signal.connect(self.on_error, Qt.QueuedConnection)
+            self.core_job.finished_signal.connect(self.on_done)
+        self.core_job.submit(self.file_model.paths, out_dir, opts_bytes)
+        self.progress_timer.start()
+
+    def serialize_options(self, opts):
+        """Returns the JSON encoding of `opts`, reusing it while the preset is unchanged."""
+        cached_opts, cached_bytes = self._opts_cache
+        if opts != cached_opts:
+            cached_bytes = json_dumps(opts)
+            self._opts_cache = (opts, cached_bytes)
+        return cached_bytes
+
+    def poll_progress(self):
+        """Timer slot that forwards the latest buffered packet (if any) to the UI."""
+        data = self.core_job.take_latest()
+        if data is not None:
+            self.on_progress(*data)
+
+    def on_progress(self, p, current_file, status):
+        """UI response handler for sampled progress packets."""
+        if p != self._last_percent:
+            self._last_percent = p
+            self.progress_bar.setValue(p)
+        self.status_msg.setText(f"{status.upper()}: {current_file.upper()}")
 
     def on_error(self, msg):
-        """Error notification handler."""
+        """
+        Error notification handler.
+        
+        Connected with Qt.QueuedConnection so the modal dialog opens from the event 
+        loop rather than re-entrantly inside a QProcess signal handler.
+        """
         QMessageBox.critical(self, "Core Error", msg)
 
     def on_done(self):
         """Clean-up and notification upon batch completion."""
+        self.progress_timer.stop()
+        self.poll_progress()
         self.process_btn.setEnabled(True)
         self.status_msg.setText("BATCH EXECUTION COMPLETE")
         self.progress_bar.setValue(100)
 
+    def closeEvent(self, event):
+        """Stops the persistent core worker with the window."""
+        if self.daemon is not None:
+            self.daemon.shutdown()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
@@ -411,6 +829,7 @@ if __name__ == "__main__":
     palette.setColor(QPalette.Window, QColor(10, 10, 12))
     palette.setColor(QPalette.WindowText, QColor(224, 224, 224))
     app.setPalette(palette)
+    app.setStyleSheet(load_stylesheet())
     
     window = ClioBulkX()
     window.show()
@@ -0,0 +1,142 @@
+"""
+---------------------------------------------------------------------------------------
+ClioBulk-X: Core IPC Helpers
+---------------------------------------------------------------------------------------
+Plain-Python plumbing shared by both GUI editions for talking to the native core:
+JSON codecs, progress-packet normalization, the incremental stdout decoder and the
+QProcess spawn settings.
+
+Optional accelerators are picked up when installed: orjson for JSON, msgpack for
+binary progress frames and the compiled `cliobulk_parse` extension for packets.
+
+@author Alejandro Ramírez
+@license MIT
+---------------------------------------------------------------------------------------
+"""
+
+import os
+import json
+import struct
+
+# Prefer the SIMD-accelerated orjson codec; stdlib json also accepts bytes.
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        """Stdlib fallback mirroring orjson.dumps (compact UTF-8 bytes)."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Compiled packet normalizer (cythonize -i cliobulk_parse.pyx); pure-Python fallback
+# with identical accept/reject behaviour.
+try:
+    from cliobulk_parse import parse_progress, normalize_progress
+except ImportError:
+    def normalize_progress(data):
+        """Extracts `(progress:int, current_file:str, status:str)` from a decoded packet."""
+        return (int(data.get("progress", 0)), data.get("current_file", ""),
+                data.get("status", "processing"))
+
+    def parse_progress(line):
+        """Parses one JSON progress line straight into a normalized tuple."""
+        return normalize_progress(json_loads(line))
+
+# Errors raised for malformed or non-object packets (OverflowError: infinite progress)
+PACKET_ERRORS = (ValueError, TypeError, AttributeError, OverflowError)
+
+# Length-prefixed MessagePack progress frames; JSON lines remain the fallback.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Header of a MessagePack progress frame: payload length as little-endian u32
+FRAME_HEADER = struct.Struct('<I')
+# Progress framing requested from the core (--ipc)
+IPC_FORMAT = "msgpack" if msgpack is not None else "json"
+
+def configure_spawn(proc):
+    """
+    Tunes how a QProcess launches the core on Linux/macOS.
+
+    Requests vfork() so spawning does not duplicate the GUI's page tables, closes
+    inherited descriptors and starts the core in its own session. Flags missing
+    from older Qt builds are skipped; Windows is unaffected.
+
+    Args:
+        proc (QProcess): Process object, configured before start().
+    """
+    if os.name == 'nt' or not hasattr(proc, 'setUnixProcessParameters'):
+        return
+    # Flags are looked up on the instance's class so this module stays Qt-free
+    unix_flags = type(proc).UnixProcessFlag
+    flags = None
+    for name in ('UseVFork', 'CloseFileDescriptors', 'CreateNewSession'):
+        flag = getattr(unix_flags, name, None)
+        if flag is not None:
+            flags = flag if flags is None else flags | flag
+    if flags is not None:
+        proc.setUnixProcessParameters(flags)
+
+class PacketDecoder:
+    """
+    Incremental decoder for the core's progress stream.
+
+    Accepts raw stdout chunks in either IPC framing and returns the newest
+    complete packet as a `(progress, current_file, status)` tuple. Only the
+    latest packet matters to the UI, so just the last complete MessagePack frame
+    is decoded, and JSON lines are scanned from the end until the first valid
+    object (non-JSON output such as debug logs is skipped).
+    """
+    def __init__(self, ipc):
+        self.ipc = ipc
+        self._buf = bytearray()
+
+    def feed(self, chunk):
+        """Appends a chunk; returns the newest complete packet tuple or None."""
+        self._buf += chunk
+        if self.ipc == "msgpack":
+            return self._take_frame()
+        return self._take_line()
+
+    def flush(self):
+        """Returns a trailing JSON packet that was not newline-terminated."""
+        if self._buf and self.ipc == "json":
+            return self.feed(b'\n')
+        return None
+
+    def _take_line(self):
+        buf = self._buf
+        end = buf.rfind(b'\n')
+        if end < 0:
+            return None
+        lines = bytes(buf[:end]).split(b'\n')
+        del buf[:end + 1]
+        for line in reversed(lines):
+            try:
+                return parse_progress(line)
+            except PACKET_ERRORS:
+                continue
+        return None
+
+    def _take_frame(self):
+        buf = self._buf
+        pos = 0
+        last = None
+        avail = len(buf)
+        while avail - pos >= FRAME_HEADER.size:
+            (n,) = FRAME_HEADER.unpack_from(buf, pos)
+            start = pos + FRAME_HEADER.size
+            if avail - start < n:
+                break
+            last = (start, start + n)
+            pos = start + n
+        if last is None:
+            return None
+        try:
+            data = normalize_progress(msgpack.unpackb(buf[last[0]:last[1]], raw=False))
+        except PACKET_ERRORS:
+            data = None
+        del buf[:pos]
+        return data
@@ -0,0 +1,35 @@
+# cython: language_level=3
+"""
+---------------------------------------------------------------------------------------
+ClioBulk-X: Compiled Progress Parser
+---------------------------------------------------------------------------------------
+Cython fast path shared by both GUI editions for turning core progress packets into
+flat `(progress, current_file, status)` tuples, pulling only the fields the UI reads.
+
+Mirrors the pure-Python fallbacks in cliobulk_ipc.py: both versions must accept and
+reject exactly the same packets. Build in place (optional; cliobulk_ipc falls back to
+pure Python when it is missing):
+    cythonize -i cliobulk_parse.pyx
+
+@author Alejandro Ramírez
+@license MIT
+---------------------------------------------------------------------------------------
+"""
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+cpdef tuple normalize_progress(dict data):
+    """Extracts `(progress:int, current_file:str, status:str)` from a decoded packet."""
+    # int() (not a C double cast) keeps parity with the fallback: numeric strings
+    # are accepted, NaN / inf raise, and large values do not wrap.
+    return (int(data.get("progress", 0)), data.get("current_file", ""),
+            data.get("status", "processing"))
+
+
+cpdef tuple parse_progress(line):
+    """Parses one JSON progress line straight into a normalized tuple."""
+    return normalize_progress(json_loads(line))